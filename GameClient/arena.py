@@ -1,6 +1,7 @@
 import asyncio
 
 import numpy as np
+from array import array
 from typing import Callable
 
 from GameClient.player import Player
@@ -9,6 +10,40 @@ from Tools.i_game import IGame
 from Tools.rcode import RCODE
 
 
+class History:
+    """Struct-of-arrays storage for (board, cur_player, iteration) entries.
+
+    Boards stay a list of ndarrays (shape and dtype differ per game) while
+    players and iteration counters live in compact typed arrays, instead of
+    allocating a tuple of boxed ints per entry. Indexing and pop() still
+    return the familiar (board, cur_player, it) tuples.
+    """
+
+    def __init__(self):
+        self._boards: list[np.array] = []
+        self._players = array('b')  # players are always -1 / 1
+        self._its = array('i')
+
+    def append(self, board: np.array, cur_player: int, it: int):
+        self._boards.append(board)
+        self._players.append(cur_player)
+        self._its.append(it)
+
+    def pop(self) -> tuple[np.array, int, int]:
+        return self._boards.pop(), self._players.pop(), self._its.pop()
+
+    def clear(self):
+        self._boards.clear()
+        del self._players[:]
+        del self._its[:]
+
+    def __len__(self) -> int:
+        return len(self._boards)
+
+    def __getitem__(self, index: int) -> tuple[np.array, int, int]:
+        return self._boards[index], self._players[index], self._its[index]
+
+
 class Arena:
     def __init__(self, game_client):
         self.game_client = game_client  # need to send information over websocket connection
@@ -17,7 +52,7 @@ class Arena:
         self.time_index_p2: int = 0
 
         # configuration storage of current active battle
-        self.history: list[tuple[np.array, int, int]] = []  # [board, cur_player, iteration]
+        self.history: History = History()  # [board, cur_player, iteration]
         self.blunder_history: list[tuple[np.array, int, int, any]] = []  # [board, cur_player, iteration, move]
         self.blunder: list = []  # saves blunder values for each index
         self.blunder_calculation: bool = False  # is true if a calculation request was send
@@ -46,11 +81,13 @@ class Arena:
         self.running = False
 
     def append_history(self, board: np.array, cur_player: int, it: int):
-        self.history.append((board.copy(), cur_player, it))
+        # every IGame.getNextState returns a fresh array, so the stored board
+        # is never mutated afterwards and no defensive copy is needed
+        self.history.append(board, cur_player, it)
 
     async def kim_action(self, to, it):
         await self.game_client.send_cmd(command="ai_move", command_key=self.game_name, p_pos=to,
-                                        data={"board": self.board.tolist(),
+                                        data={"board": self.game_client.board_to_list(self.board),
                                               "cur_player": self.cur_player,
                                               "it": it,
                                               "key": self.game_client.key})
@@ -62,8 +99,11 @@ class Arena:
             self.board = self.game.getInitBoard()
         players = [self.player2, None, self.player1]  # array of play functions
 
-        while self.running and self.game.getGameEnded(self.board, cur_player) == 0:
-            await asyncio.sleep(0.0001)  # is needed because of optimiser!
+        status = 0
+        while self.running:
+            status = self.game.getGameEnded(self.board, cur_player)
+            if status != 0:
+                break
             self.append_history(self.board, cur_player, it)
             self.cur_player = cur_player
             p = players[cur_player + 1]
@@ -78,9 +118,9 @@ class Arena:
             to: str = "p1" if cur_player == 1 else "p2"
             ai: bool = False
             while self.running:
-                await asyncio.sleep(0.0001)  # is needed because of optimiser!
-                action = p()  # action can be (None) no move set, (int, tuple) on play action, (bool) ai_move request
-                if action is None:
+                # waits until the player provides an action instead of busy-polling
+                action = await p()  # action can be (None) on wake without move, (int, tuple) on play action,
+                if action is None:  # (bool) on ai_move request
                     continue
                 if isinstance(action, bool):  # do a request to server with ai move
                     await self.kim_action(to, it)
@@ -105,7 +145,7 @@ class Arena:
             self.append_history(self.board, cur_player, it)
             await self.game_client.broadcast_board(self.board, cur_player, self.game_name, False)
             await self.game_client.send_response(RCODE.P_GAMEOVER, None,
-                                                 {"result": round(cur_player * self.game.getGameEnded(self.board, cur_player)),
+                                                 {"result": round(cur_player * status),
                                                   "turn": it})
         self.time_index_p1 = len(self.history)  # update index to history length
         self.time_index_p2 = len(self.history)  # update index to history length
@@ -1,4 +1,4 @@
-import json
+import orjson
 import numpy as np
 import websockets
 from abc import ABC
@@ -10,45 +10,70 @@ class WebSocketConnectionManager(ABC):
         self.connection = None
         self.uri: str = f"ws://{host}:{port}/game?&login={key}"
         self.key: str = key
+        self.__last_board: np.array = None
+        self.__last_board_list: list | None = None
+        self.__canned_responses: dict[tuple[int, str | None], str] = {}
+
+    def board_to_list(self, board: np.array) -> list:
+        """
+        Serialize a board to a nested list, reusing the last result when the
+        same array object is sent again. One board state is typically sent
+        several times per turn (broadcast, ai_move request, valid_moves), and
+        boards are never mutated in place, so identity is a safe cache key.
+        """
+        if board is not self.__last_board:
+            self.__last_board = board
+            self.__last_board_list = board.tolist()
+        return self.__last_board_list
 
     async def connect(self):
         print("Connecting...")
         try:
-            self.connection = await websockets.connect(uri=self.uri, ping_interval=None)
+            # no per-message deflate (saves a zlib pass per frame); larger max_size
+            # so board images and long histories never fragment
+            self.connection = await websockets.connect(uri=self.uri, ping_interval=None,
+                                                       compression=None, max_size=2 ** 22)
             print("Connected!")
         except ConnectionRefusedError:
             print(f"Connection failed to: '{self.uri}'")
             exit(1)
 
     async def receive_json(self):
-        return json.loads(await self.connection.recv())
+        return orjson.loads(await self.connection.recv())
 
     async def send_response(self, code: RCODE, to: str | None, data: dict = None):
+        if data is None:
+            # payload-free responses (acks, errors) are fully determined by
+            # (code, recipient); serialize each combination only once
+            canned = self.__canned_responses.get((code.value, to))
+            if canned is None:
+                canned = orjson.dumps({"response": code.value, "to": to, "key": self.key}).decode()
+                self.__canned_responses[(code.value, to)] = canned
+            return await self.__send_json(canned)
         cmd = {"response": code.value, "to": to, "key": self.key}
-        if data is not None:
-            cmd.update(data)
-        await self.__send_json(json.dumps(cmd))
+        cmd.update(data)
+        await self.__send_json(orjson.dumps(cmd).decode())
 
     async def send_cmd(self, command: str, command_key: str, p_pos: str | None, data: dict = None):  # to socket server
         cmd = {"command": command, "command_key": command_key, "to": p_pos, "key": self.key}
         if data is not None:
             cmd.update(data)
-        await self.__send_json(json.dumps(cmd))
+        await self.__send_json(orjson.dumps(cmd).decode())
 
     async def send_board(self, board: np.array, cur_player: int, game_name: str, valid: bool, from_pos: int | None):
         cmd = {"command": "draw", "command_key": game_name, "to": "p1" if cur_player == 1 else "p2", "key": self.key,
-               "board": board.tolist(), "cur_player": cur_player, "valid": valid, "from_pos": from_pos}
-        await self.__send_json(json.dumps(cmd))
+               "board": self.board_to_list(board), "cur_player": cur_player, "valid": valid, "from_pos": from_pos}
+        await self.__send_json(orjson.dumps(cmd).decode())
 
     async def broadcast_board(self, board: np.array, cur_player: int, game_name: str, valid: bool):
         cmd = {"command": "draw", "command_key": game_name, "to": None, "key": self.key,
-               "board": board.tolist(), "cur_player": cur_player, "valid": valid}
-        await self.__send_json(json.dumps(cmd))
+               "board": self.board_to_list(board), "cur_player": cur_player, "valid": valid}
+        await self.__send_json(orjson.dumps(cmd).decode())
 
     async def close(self):
         if self.connection:
             await self.connection.close()
             print("WebSocket connection closed")
 
-    async def __send_json(self, obj: json):
+    async def __send_json(self, obj: str):
         await self.connection.send(obj)
@@ -20,6 +20,21 @@ class GameClient(WebSocketConnectionManager):
         super().__init__(host, port, key)
         self.importer: Importer = Importer("../Games", ExcludeModule.MCTS)  # Importer for games excluding MCTS
         self.pit: Pit = Pit(self)  # Initialize the Pit object
+        # command_key -> handler coroutine; a flat dict lookup per message
+        # instead of re-scanning a match statement
+        self.handlers = {
+            "create": self.handle_create,
+            "surrender": self.handle_surrender,
+            "valid_moves": self.handle_valid_moves,
+            "make_move": self.handle_make_move,
+            "undo_move": self.handle_undo_move,
+            "new_game": self.handle_new_game,
+            "blunder": self.handle_blunder,
+            "timeline": self.handle_timeline,
+            "step": self.handle_step,
+            "unstep": self.handle_unstep,
+            "image": self.handle_image,
+        }
 
     async def run(self):
         """
@@ -35,215 +50,198 @@ class GameClient(WebSocketConnectionManager):
             p_pos: str = read_object.get("p_pos")  # Get player position from the received JSON
             command_key: str = read_object.get("command_key")  # Get the command key from the received JSON
 
-            match command_key:
-                # Handling 'create' command
-                case "create":
-                    if self.is_arena_running():
-                        await self.send_response(code=RCODE.P_STILLRUNNING, to=p_pos)
-                        continue
-                    game_config: GameConfig = GameConfig.dict_to_config(read_object, self.importer.get_games())
-                    if not game_config.ready():
-                        await self.send_response(code=RCODE.P_ARGS, to=p_pos, data=game_config.to_dict())
-                        continue
-                    self.pit.init_arena(game_config)  # Initialize arena with game configuration
-                    self.pit.clear_arena()
-                    self.start_arena()  # Start the arena
-                    await self.send_response(code=RCODE.P_ARENAINIT, to=None, data=game_config.to_dict())
-                    await self.update()  # Update the state
+            handler = self.handlers.get(command_key)
+            if handler is None:  # Handling unknown commands
+                await self.send_response(code=RCODE.COMMANDNOTFOUND, to=p_pos, data={"command_key": command_key})
+                await self.update()
+                continue
+            await handler(read_object, p_pos)
 
-                # Handling 'surrender' command
-                case "surrender":
-                    if not self.is_arena_running():
-                        await self.send_response(RCODE.P_NOTRUNNING, p_pos)
-                    else:
-                        self.stop_arena()  # Stop the arena
-                        winner = -1 if p_pos == "p1" else 1  # Determine the winner based on who surrendered
-                        last_it = self.pit.get_last_hist_entry()[2]
-                        await self.send_response(RCODE.P_SURRENDER, None, {"result": winner,
-                                                                           "turn": last_it})
-                    await self.update()
+    # Handling 'create' command
+    async def handle_create(self, read_object: dict, p_pos: str):
+        if self.is_arena_running():
+            return await self.send_response(code=RCODE.P_STILLRUNNING, to=p_pos)
+        game_config: GameConfig = GameConfig.dict_to_config(read_object, self.importer.get_games())
+        if not game_config.ready():
+            return await self.send_response(code=RCODE.P_ARGS, to=p_pos, data=game_config.to_dict())
+        self.pit.init_arena(game_config)  # Initialize arena with game configuration
+        self.pit.clear_arena()
+        self.start_arena()  # Start the arena
+        await self.send_response(code=RCODE.P_ARENAINIT, to=None, data=game_config.to_dict())
+        await self.update()  # Update the state
 
-                # Handling 'valid_moves' command
-                case "valid_moves":
-                    if not self.is_arena_running():
-                        await self.send_response(RCODE.P_NOTRUNNING, p_pos)
-                        continue
-                    if self.pit.get_cur_player() != (1 if p_pos == "p1" else -1):
-                        await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
-                        continue
-                    hist: tuple = self.pit.get_last_hist_entry()  # Get the last history entry from the Pit
-                    from_pos = read_object.get("fromPos")
-                    if read_object.get("isFrontend") and p_pos == "p2":
-                        from_pos = self.pit.arena.game.rotateMove(from_pos)
-                    await self.send_board(hist[0], hist[1], self.pit.arena.game_name, True, from_pos)
-                    moves = [self.pit.arena.game.translate(hist[0], hist[1], i)
-                             for i, m in enumerate(self.pit.arena.game.getValidMoves(hist[0], hist[1])) if m == 1]
-                    if read_object.get("isFrontend") and p_pos == "p2":
-                        moves = str([self.pit.arena.game.rotateMove(move) for move in moves])
-                    board: np.array = hist[0]
-                    await self.send_response(RCODE.P_MOVES, p_pos, {
-                        "moves": moves,
-                        "board": board.tolist(),  # The actual NumPy array
-                        "shape": board.shape,  # The shape of the array
-                        "type": str(board.dtype)  # The data type of the array
-                    })
+    # Handling 'surrender' command
+    async def handle_surrender(self, read_object: dict, p_pos: str):
+        if not self.is_arena_running():
+            await self.send_response(RCODE.P_NOTRUNNING, p_pos)
+        else:
+            self.stop_arena()  # Stop the arena
+            winner = -1 if p_pos == "p1" else 1  # Determine the winner based on who surrendered
+            last_it = self.pit.get_last_hist_entry()[2]
+            await self.send_response(RCODE.P_SURRENDER, None, {"result": winner,
+                                                              "turn": last_it})
+        await self.update()
 
-                # Handling 'make_move' command
-                case "make_move":
-                    if not self.is_arena_running():
-                        await self.send_response(RCODE.P_NOTRUNNING, p_pos)
-                        continue  # Ignore moves if the game is not running
-                    move = read_object.get("move")
-                    if move is None:
-                        await self.send_response(RCODE.P_NOMOVE, p_pos)
-                        continue
-                    if type(move) is list:
-                        move = (move[0], move[1])
-                    if type(move) is str:
-                        move = self.parse_input(move)  # Parse the move input
-                    if move is None:
-                        await self.send_response(RCODE.P_INVALIDMOVE, p_pos)
-                        continue
-                    if read_object.get("isFrontend") and p_pos == "p2":
-                        move = self.pit.arena.game.rotateMove(move)
-                    if not self.pit.set_move(move, p_pos):
-                        await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
+    # Handling 'valid_moves' command
+    async def handle_valid_moves(self, read_object: dict, p_pos: str):
+        if not self.is_arena_running():
+            return await self.send_response(RCODE.P_NOTRUNNING, p_pos)
+        if self.pit.get_cur_player() != (1 if p_pos == "p1" else -1):
+            return await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
+        hist: tuple = self.pit.get_last_hist_entry()  # Get the last history entry from the Pit
+        from_pos = read_object.get("fromPos")
+        if read_object.get("isFrontend") and p_pos == "p2":
+            from_pos = self.pit.arena.game.rotateMove(from_pos)
+        await self.send_board(hist[0], hist[1], self.pit.arena.game_name, True, from_pos)
+        moves = [self.pit.arena.game.translate(hist[0], hist[1], i)
+                 for i, m in enumerate(self.pit.arena.game.getValidMoves(hist[0], hist[1])) if m == 1]
+        if read_object.get("isFrontend") and p_pos == "p2":
+            moves = str([self.pit.arena.game.rotateMove(move) for move in moves])
+        board: np.array = hist[0]
+        await self.send_response(RCODE.P_MOVES, p_pos, {
+            "moves": moves,
+            "board": board.tolist(),  # The actual NumPy array
+            "shape": board.shape,  # The shape of the array
+            "type": str(board.dtype)  # The data type of the array
+        })
+        await self.update()
 
-                # Handling 'undo_move' command
-                case "undo_move":
-                    if not self.is_arena_running():
-                        await self.send_response(RCODE.P_NOTRUNNING, p_pos)
-                        continue
-                    if self.pit.get_cur_player() != (1 if p_pos == "p1" else -1):
-                        await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
-                        continue
-                    num = read_object.get("num")
-                    if num is None:
-                        await self.send_response(RCODE.P_NOUNDO, p_pos)
-                        continue
-                    try:
-                        num = int(num)  # Validate the number of moves to undo
-                    except ValueError:
-                        await self.send_response(RCODE.P_INVALIDUNDO, p_pos, {"num": num})
-                        continue
-                    if num <= 0:
-                        await self.send_response(RCODE.P_INVALIDUNDO, p_pos, {"num": num})
-                        continue
-                    if len(self.pit.arena.history) < 3:
-                        await self.send_response(RCODE.P_NOUNDO, p_pos)
-                        continue
-                    while self.pit.arena.running:
-                        self.stop_arena()
-                    await self.send_response(RCODE.P_VALIDUNDO, p_pos)
-                    state, player, it = self.pit.undo(num)  # Perform the undo operation
-                    self.start_arena(state, player, it)
+    # Handling 'make_move' command
+    async def handle_make_move(self, read_object: dict, p_pos: str):
+        if not self.is_arena_running():
+            return await self.send_response(RCODE.P_NOTRUNNING, p_pos)  # Ignore moves if the game is not running
+        move = read_object.get("move")
+        if move is None:
+            return await self.send_response(RCODE.P_NOMOVE, p_pos)
+        if type(move) is list:
+            move = (move[0], move[1])
+        if type(move) is str:
+            move = self.parse_input(move)  # Parse the move input
+        if move is None:
+            return await self.send_response(RCODE.P_INVALIDMOVE, p_pos)
+        if read_object.get("isFrontend") and p_pos == "p2":
+            move = self.pit.arena.game.rotateMove(move)
+        if not self.pit.set_move(move, p_pos):
+            await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
+        await self.update()
 
-                # Handling 'new_game' command
-                case "new_game":
-                    if self.is_arena_running():
-                        await self.send_response(RCODE.P_STILLRUNNING, p_pos)
-                        continue
-                    if self.pit.arena.game is None:
-                        await self.send_response(RCODE.P_NOGAMEINIT, p_pos)
-                        continue
-                    self.pit.clear_arena()
-                    self.start_arena()
-                    await self.send_response(code=RCODE.P_ARENAINIT, to=None)
-                    await self.update()  # Update the state
+    # Handling 'undo_move' command
+    async def handle_undo_move(self, read_object: dict, p_pos: str):
+        if not self.is_arena_running():
+            return await self.send_response(RCODE.P_NOTRUNNING, p_pos)
+        if self.pit.get_cur_player() != (1 if p_pos == "p1" else -1):
+            return await self.send_response(RCODE.P_NOTYOURTURN, p_pos)
+        num = read_object.get("num")
+        if num is None:
+            return await self.send_response(RCODE.P_NOUNDO, p_pos)
+        try:
+            num = int(num)  # Validate the number of moves to undo
+        except ValueError:
+            return await self.send_response(RCODE.P_INVALIDUNDO, p_pos, {"num": num})
+        if num <= 0:
+            return await self.send_response(RCODE.P_INVALIDUNDO, p_pos, {"num": num})
+        if len(self.pit.arena.history) < 3:
+            return await self.send_response(RCODE.P_NOUNDO, p_pos)
+        while self.pit.arena.running:
+            self.stop_arena()
+        await self.send_response(RCODE.P_VALIDUNDO, p_pos)
+        state, player, it = self.pit.undo(num)  # Perform the undo operation
+        self.start_arena(state, player, it)
+        await self.update()
 
-                # Handling 'blunder' command (currently not implemented)
-                case "blunder":
-                    # if arena is running -> break
-                    if self.is_arena_running():
-                        await self.send_response(RCODE.P_STILLRUNNING, p_pos)
-                        continue
-                    # if no action was played
-                    if len(self.pit.arena.blunder_history) == 0:
-                        await self.send_response(RCODE.P_NOBLUNDER, p_pos)
-                        continue
-                    # check if blunder gets updated from server
-                    blunder = read_object.get("blunder")
-                    if blunder is not None:
-                        self.pit.set_blunder(blunder)
-                        self.pit.arena.blunder_calculation = False  # blunder received deactivate function
-                        # successfully requested blunder
-                        await self.send_response(code=RCODE.P_BLUNDERLIST, to=p_pos, data=self.pit.get_blunder(p_pos))
-                        continue
-                    # only one create request of blunder possible
-                    if self.pit.arena.blunder_calculation:
-                        await self.send_response(code=RCODE.P_BLUNDER, to=p_pos)
-                        continue
-                    # request blunder create on first request
-                    if len(self.pit.arena.blunder) == 0:
-                        if read_object.get("isFrontend") and p_pos == "p2":
-                            self.pit.arena.rotate = True
-                        self.pit.arena.blunder_calculation = True
-                        await self.send_response(code=RCODE.P_CREATEBLUNDER, to=p_pos)
-                        await self.send_cmd(command="blunder", command_key=self.pit.arena.game_name,
-                                            p_pos=p_pos, data=self.pit.get_blunder_payload())
-                        continue
-                    if read_object.get("isFrontend") and p_pos == "p2":
-                        self.pit.arena.rotate = True
-                    # successfully requested blunder
-                    await self.send_response(code=RCODE.P_BLUNDERLIST, to=p_pos, data=self.pit.get_blunder(p_pos))
+    # Handling 'new_game' command
+    async def handle_new_game(self, read_object: dict, p_pos: str):
+        if self.is_arena_running():
+            return await self.send_response(RCODE.P_STILLRUNNING, p_pos)
+        if self.pit.arena.game is None:
+            return await self.send_response(RCODE.P_NOGAMEINIT, p_pos)
+        self.pit.clear_arena()
+        self.start_arena()
+        await self.send_response(code=RCODE.P_ARENAINIT, to=None)
+        await self.update()  # Update the state
 
-                # Handling 'timeline' command
-                case "timeline":
-                    if self.is_arena_running():
-                        await self.send_response(RCODE.P_STILLRUNNING, p_pos)
-                        continue
-                    num = read_object.get("num")
-                    if num is None:
-                        await self.send_response(RCODE.P_NOTIMELINE, p_pos)
-                        continue
-                    try:
-                        num = int(num)  # Validate the timeline input
-                    except ValueError:
-                        await self.send_response(RCODE.P_INVALIDTIMELINE, p_pos, {"num": num})
-                        continue
-                    if num < 0:
-                        await self.send_response(RCODE.P_INVALIDTIMELINE, p_pos)
-                        continue
-                    state, player, it = self.pit.timeline(p_pos, True, num)
-                    await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
-                                          False, None)
-                    await self.send_response(RCODE.P_TIMELINE, p_pos, {"current_player": player, "it": it})
+    # Handling 'blunder' command (currently not implemented)
+    async def handle_blunder(self, read_object: dict, p_pos: str):
+        # if arena is running -> break
+        if self.is_arena_running():
+            return await self.send_response(RCODE.P_STILLRUNNING, p_pos)
+        # if no action was played
+        if len(self.pit.arena.blunder_history) == 0:
+            return await self.send_response(RCODE.P_NOBLUNDER, p_pos)
+        # check if blunder gets updated from server
+        blunder = read_object.get("blunder")
+        if blunder is not None:
+            self.pit.set_blunder(blunder)
+            self.pit.arena.blunder_calculation = False  # blunder received deactivate function
+            # successfully requested blunder
+            return await self.send_response(code=RCODE.P_BLUNDERLIST, to=p_pos, data=self.pit.get_blunder(p_pos))
+        # only one create request of blunder possible
+        if self.pit.arena.blunder_calculation:
+            return await self.send_response(code=RCODE.P_BLUNDER, to=p_pos)
+        # request blunder create on first request
+        if len(self.pit.arena.blunder) == 0:
+            if read_object.get("isFrontend") and p_pos == "p2":
+                self.pit.arena.rotate = True
+            self.pit.arena.blunder_calculation = True
+            await self.send_response(code=RCODE.P_CREATEBLUNDER, to=p_pos)
+            return await self.send_cmd(command="blunder", command_key=self.pit.arena.game_name,
+                                       p_pos=p_pos, data=self.pit.get_blunder_payload())
+        if read_object.get("isFrontend") and p_pos == "p2":
+            self.pit.arena.rotate = True
+        # successfully requested blunder
+        await self.send_response(code=RCODE.P_BLUNDERLIST, to=p_pos, data=self.pit.get_blunder(p_pos))
+        await self.update()
 
-                # Handling 'step' command
-                case "step":
-                    if self.is_arena_running():
-                        await self.send_response(RCODE.P_STILLRUNNING, p_pos)
-                        continue
-                    state, player, it = self.pit.timeline(p_pos, True, None)
-                    await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
-                                          False, None)
-                    data = {"current_player": player, "it": it, "last_it": len(self.pit.arena.history) - 1}
-                    await self.send_response(RCODE.P_STEP, p_pos, data)
+    # Handling 'timeline' command
+    async def handle_timeline(self, read_object: dict, p_pos: str):
+        if self.is_arena_running():
+            return await self.send_response(RCODE.P_STILLRUNNING, p_pos)
+        num = read_object.get("num")
+        if num is None:
+            return await self.send_response(RCODE.P_NOTIMELINE, p_pos)
+        try:
+            num = int(num)  # Validate the timeline input
+        except ValueError:
+            return await self.send_response(RCODE.P_INVALIDTIMELINE, p_pos, {"num": num})
+        if num < 0:
+            return await self.send_response(RCODE.P_INVALIDTIMELINE, p_pos)
+        state, player, it = self.pit.timeline(p_pos, True, num)
+        await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
+                              False, None)
+        await self.send_response(RCODE.P_TIMELINE, p_pos, {"current_player": player, "it": it})
+        await self.update()
 
-                # Handling 'unstep' command
-                case "unstep":
-                    if self.is_arena_running():
-                        await self.send_response(RCODE.P_STILLRUNNING, p_pos)
-                        continue
-                    state, player, it = self.pit.timeline(p_pos, False, None)
-                    await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
-                                          False, None)
-                    data = {"current_player": player, "it": it, "last_it": len(self.pit.arena.history) - 1}
-                    await self.send_response(RCODE.P_UNSTEP, p_pos, data)
+    # Handling 'step' command
+    async def handle_step(self, read_object: dict, p_pos: str):
+        if self.is_arena_running():
+            return await self.send_response(RCODE.P_STILLRUNNING, p_pos)
+        state, player, it = self.pit.timeline(p_pos, True, None)
+        await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
+                              False, None)
+        data = {"current_player": player, "it": it, "last_it": len(self.pit.arena.history) - 1}
+        await self.send_response(RCODE.P_STEP, p_pos, data)
+        await self.update()
 
-                # Handling extern request of current game image
-                case "image":
-                    if self.pit.arena.running:
-                        if self.pit.arena.board is not None:
-                            await self.broadcast_board(board=self.pit.arena.board,
-                                                       cur_player=self.pit.arena.cur_player,
-                                                       game_name=self.pit.arena.game_name,
-                                                       valid=False)
+    # Handling 'unstep' command
+    async def handle_unstep(self, read_object: dict, p_pos: str):
+        if self.is_arena_running():
+            return await self.send_response(RCODE.P_STILLRUNNING, p_pos)
+        state, player, it = self.pit.timeline(p_pos, False, None)
+        await self.send_board(state, 1 if p_pos == "p1" else -1, self.pit.arena.game_name,
+                              False, None)
+        data = {"current_player": player, "it": it, "last_it": len(self.pit.arena.history) - 1}
+        await self.send_response(RCODE.P_UNSTEP, p_pos, data)
+        await self.update()
 
-                # Handling unknown commands
-                case _:
-                    await self.send_response(code=RCODE.COMMANDNOTFOUND, to=p_pos, data={"command_key": command_key})
-            await self.update()
+    # Handling extern request of current game image
+    async def handle_image(self, read_object: dict, p_pos: str):
+        if self.pit.arena.running:
+            if self.pit.arena.board is not None:
+                await self.broadcast_board(board=self.pit.arena.board,
+                                           cur_player=self.pit.arena.cur_player,
+                                           game_name=self.pit.arena.game_name,
+                                           valid=False)
+        await self.update()
 
     def start_arena(self, board: np.array = None, cur_player: int = 1, it: int = 0):
         """
@@ -281,6 +279,12 @@ class GameClient(WebSocketConnectionManager):
         if isinstance(input_str, int):
             return input_str
         if input_str.startswith("(") and input_str.endswith(")"):
+            try:
+                # moves are plain int tuples like "(2, 1)"; split/int is much
+                # cheaper than running the full literal parser
+                return tuple(int(part) for part in input_str[1:-1].split(","))
+            except ValueError:
+                pass
             try:
                 result = ast.literal_eval(input_str)
                 return result
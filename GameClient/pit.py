@@ -1,9 +1,12 @@
 import asyncio
+import logging
 import numpy as np
 from GameClient.arena import Arena
 from GameClient.player import Player
 from Tools.Game_Config.game_config import GameConfig
 
+log = logging.getLogger(__name__)
+
 
 # The Pit class manages the game interactions and states
 class Pit:
@@ -12,6 +15,8 @@ class Pit:
         self.game_client = game_client
         # Create an arena instance using the game client
         self.arena: Arena = Arena(game_client)
+        # Handle of the running play task, needed to cancel it on restarts
+        self.arena_task: asyncio.Task | None = None
         # Initialize two players
         self.player1: Player = Player()
         self.player2: Player = Player()
@@ -24,16 +29,23 @@ class Pit:
 
     # Start the battle in the arena
     def start_battle(self, board: np.array, cur_player: int, it: int):
+        # Cancel a play task that is still unwinding from a previous stop so
+        # two play loops never run concurrently (e.g. undo restarts instantly)
+        if self.arena_task is not None and not self.arena_task.done():
+            self.arena_task.cancel()
         # Set the arena's running status to True
         self.arena.running = True
         self.arena.board = board
         # Create and start an asynchronous task to play the game in the arena
-        asyncio.create_task(self.arena.play(cur_player=cur_player, it=it))
+        self.arena_task = asyncio.create_task(self.arena.play(cur_player=cur_player, it=it))
 
     # Stop the battle in the arena
     def stop_battle(self) -> None:
         # Call the arena's stop method to halt the game
         self.arena.stop()
+        # Wake blocked player waits so the play task can observe the stop
+        self.player1.wake()
+        self.player2.wake()
 
     # Set the move for a player
     def set_move(self, move, pos) -> bool:
@@ -41,10 +53,10 @@ class Pit:
         if self.get_cur_player() == (1 if pos == "p1" else -1):
             # Set the move for player 1
             if pos == "p1":
-                self.player1.move = move
+                self.player1.set_move(move)
             # Set the move for player 2
             elif pos == "p2":
-                self.player2.move = move
+                self.player2.set_move(move)
             return True  # It is the player's turn
         return False  # Not the player's turn
 
@@ -65,8 +77,8 @@ class Pit:
             case 2 | 5:  # kim_vs_player or kim_vs_playerai
                 play1 = self.player1.playAI
                 play2 = self.player2.play
-        # Print the new game configuration
-        print("New game loaded:", game_config)
+        # Log the new game configuration (lazy formatting, skipped below INFO)
+        log.info("New game loaded: %s", game_config)
         # Set the arena with the game and player configurations
         self.arena.set_arena(game_config.game, game_config.game_name, game_config.difficulty, play1, play2)
 
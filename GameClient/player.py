@@ -1,3 +1,6 @@
+import asyncio
+
+
 class Player:
     def __init__(self):
         """
@@ -7,38 +10,59 @@ class Player:
             move (None or any): Represents the current move of the player.
                                 Initially set to None indicating no move has been made yet.
             send (bool): A flag to indicate if a move has been sent. Initially set to False.
+            action_ready (asyncio.Event): Signals a waiting arena that an action is available.
         """
         self.move = None
         self.send = False
+        self.action_ready = asyncio.Event()
+
+    def set_move(self, move):
+        """
+        Stores a move coming from the client and wakes a waiting arena.
+
+        Parameters:
+            move (any): The move the player wants to play.
+        """
+        self.move = move
+        self.action_ready.set()
+
+    def wake(self):
+        """
+        Wakes a waiting arena without providing a move.
+
+        Used when the battle is stopped so a blocked play()/playAI() call
+        can return (with None) and the arena task can observe the stop.
+        """
+        self.action_ready.set()
 
-    def play(self):
+    async def play(self):
         """
-        Processes and returns the current move of the player.
+        Waits for and returns the current move of the player.
 
-        This method retrieves the player's move, resets the move attribute to None,
-        and then returns the move. If no move has been set (move is None), it returns None.
+        This method waits until a move was provided via set_move (or the player
+        was woken via wake), resets the move attribute to None, and then returns
+        the move. If no move has been set (move is None), it returns None.
 
         Returns:
             temp (None or any): The move that was made by the player. If no move was made, returns None.
         """
+        # Wait until a move is available instead of polling for it
+        await self.action_ready.wait()
+        self.action_ready.clear()
         # Store the current move in a temporary variable
         temp = self.move
         # Reset the move to None, indicating the move has been processed
         self.move = None
-        # If there was no move, return None
-        if temp is None:
-            return temp
-        # Return the move that was made
+        # Return the move that was made (None if woken without a move)
         return temp
 
-    def playAI(self):
+    async def playAI(self):
         """
         Simulates an AI player making a move.
 
         This method checks the send flag to determine if a move should be made. If the flag is False,
         it sets it to True and returns True, indicating an AI move should be made. If the flag is True,
-        it processes and returns the current move, resets the move attribute to None, and sets the
-        send flag back to False.
+        it waits for the move, resets the move attribute to None, and sets the send flag back to False.
 
         Returns:
             (bool or any): If the send flag was initially False, returns True to indicate an AI move.
@@ -48,6 +72,9 @@ class Player:
         if not self.send:
             self.send = True
             return True
+        # Wait until the AI move arrived instead of polling for it
+        await self.action_ready.wait()
+        self.action_ready.clear()
         # Store the current move in a temporary variable
         temp = self.move
         # Reset the move to None, indicating the move has been processed
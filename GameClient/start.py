@@ -2,6 +2,14 @@ import asyncio  # Importing the asyncio library for asynchronous programming
 from os import environ  # Importing environ from the os module to access environment variables
 from game_client import GameClient  # Importing the GameClient class from the game_client module
 
+try:
+    # Use the libuv-based event loop when available; it removes the Python-level
+    # selector overhead from every websocket send/recv of the game loop
+    import uvloop
+    uvloop.install()
+except ImportError:  # pragma: no cover - optional on dev machines
+    pass
+
 
 # Define the main function which sets up and runs the GameClient
 def main():
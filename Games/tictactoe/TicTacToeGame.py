@@ -1,5 +1,12 @@
+from functools import lru_cache
+
 from Tools.i_game import IGame, np
-from Games.tictactoe.TicTacToeLogic import Board
+from Games.tictactoe.TicTacToeLogic import Board, WIN_MASKS
+
+try:  # only the server image ships pygame; the game client runs headless
+    import pygame
+except ImportError:
+    pygame = None
 
 """
 Game class implementation for the game of TicTacToe.
@@ -11,15 +18,93 @@ Date: Jan 5, 2018.
 Based on the OthelloGame by Surag Nair.
 """
 
+# Bit i of a mask corresponds to the flattened cell (i // 3, i % 3).
+CELL_BITS = 1 << np.arange(9, dtype=np.uint32)
+FULL_BOARD = 0b111111111
+
+
+def _build_valids_lut() -> tuple:
+    """Valid-move vector for every possible 9-bit occupancy mask.
+
+    Indexed with (x_mask | o_mask), so getValidMoves becomes a single table
+    lookup instead of a Board construction plus a Python loop.
+    """
+    lut = []
+    for occupied in range(FULL_BOARD + 1):
+        valids = np.zeros(3 * 3 + 1, dtype=np.int8)
+        if occupied == FULL_BOARD:  # no free cell left -> only the pass bit
+            valids[-1] = 1
+        else:
+            for cell in range(9):
+                if not occupied & (1 << cell):
+                    valids[cell] = 1
+        lut.append(valids)
+    return tuple(lut)
+
+
+VALIDS_LUT = _build_valids_lut()
+
+
+def _build_sym_idx() -> np.array:
+    """(8, 9) index permutations of the flattened board under the 8 board
+    symmetries, in the same order getSymmetries used to generate them."""
+    cells = np.arange(9).reshape(3, 3)
+    perms = []
+    for i in range(1, 5):
+        for flip in (True, False):
+            transformed = np.rot90(cells, i)
+            if flip:
+                transformed = np.fliplr(transformed)
+            perms.append(transformed.ravel())
+    return np.stack(perms)
+
+
+SYM_IDX = _build_sym_idx()
+
+
+@lru_cache(maxsize=None)
+def _winner(x: int, o: int) -> int:
+    """Memoized sign of the side holding a line (1 for x, -1 for o, 0 for
+    none); MCTS revisits the same positions thousands of times and there are
+    only ~3^9 of them. Player-independent, so both perspectives share one
+    cache entry and the perspective is applied by a sign flip."""
+    if (x | o).bit_count() < 5:  # a win needs at least 3 + 2 placed pieces
+        return 0
+    if x.bit_count() >= 3 and any((x & m) == m for m in WIN_MASKS):
+        return 1
+    if o.bit_count() >= 3 and any((o & m) == m for m in WIN_MASKS):
+        return -1
+    return 0
+
 
 class TicTacToeGame(IGame):
+    # cached pygame drawing state, built lazily on the first draw() call
+    _pygame_initialized = False
+    _bg_surface = None
+    _x_surface = None
+    _o_surface = None
+    _valid_surface = None
+
     def __init__(self, n=3):
+        # the bundled model only supports 3x3; the fast paths below (bitboard
+        # LUTs, symmetry table) are built for exactly that size
+        assert n == 3, "TicTacToeGame only supports n=3"
         self.n = n
+        # action index -> (row, col), avoids a div/mod pair per state transition
+        self._a2m = tuple((a // n, a % n) for a in range(n * n))
+
+    @staticmethod
+    def toBitBoard(board: np.array) -> tuple[int, int]:
+        """pack the numpy board into two 9-bit masks (player 1, player -1)"""
+        flat = board.ravel()
+        x = int(CELL_BITS[flat == 1].sum())
+        o = int(CELL_BITS[flat == -1].sum())
+        return x, o
 
     def getInitBoard(self):
         """return initial board (numpy board)"""
         b = Board(self.n)
-        return np.array(b.pieces)
+        return np.array(b.pieces, dtype=np.int8)  # values are in {-1, 0, 1}
 
     def getBoardSize(self):
         return self.n, self.n
@@ -35,35 +120,25 @@ class TicTacToeGame(IGame):
            action must be a valid move"""
         if action == self.n * self.n:  # same as with getActionSize => TTT has actually no possibility to pass a move
             return board, -player
-        b = Board(self.n)
-        b.pieces = np.copy(board)
-        move = (int(action / self.n), action % self.n)
-        b.execute_move(move, player)
-        return b.pieces, -player
+        move = self._a2m[action]
+        if board[move] != 0:
+            raise ValueError(f"Illegal Move: {move}")
+        board = np.copy(board)
+        board[move] = player
+        return board, -player
 
     def getValidMoves(self, board, player):
         """return a fixed size binary vector"""
-        valids = [0] * self.getActionSize()
-        b = Board(self.n)
-        b.pieces = np.copy(board)
-        legalMoves = b.get_legal_moves()
-        if len(legalMoves) == 0:  # same as with getActionSize => TTT has actually no possibility to pass a move
-            valids[-1] = 1
-            return np.array(valids)
-        for x, y in legalMoves:
-            valids[self.n * x + y] = 1
-        return np.array(valids)
+        x, o = self.toBitBoard(board)
+        return VALIDS_LUT[x | o]
 
     def getGameEnded(self, board, player):
         """return 0 if not ended, 1 if player won, -1 if player lost"""
-        b = Board(self.n)
-        b.pieces = np.copy(board)
-
-        if b.is_win(player):
-            return 1
-        if b.is_win(-player):
-            return -1
-        if b.has_legal_moves():
+        x, o = self.toBitBoard(board)
+        w = _winner(x, o)
+        if w:
+            return w * player  # flip into the asking player's perspective
+        if (x | o) != FULL_BOARD:
             return 0
         # draw has a very little value
         return 1e-4
@@ -71,18 +146,9 @@ class TicTacToeGame(IGame):
     def getSymmetries(self, board, pi):
         # mirror, rotational
         assert (len(pi) == self.n ** 2 + 1)
-        pi_board = np.reshape(pi[:-1], (self.n, self.n))   # same as with getActionSize => TTT has actually
-        x = []                                                     # no possibility to pass a move
-
-        for i in range(1, 5):
-            for j in [True, False]:
-                newB = np.rot90(board, i)
-                newPi = np.rot90(pi_board, i)
-                if j:
-                    newB = np.fliplr(newB)
-                    newPi = np.fliplr(newPi)
-                x += [(newB, list(newPi.ravel()) + [pi[-1]])]  # same here with pass move
-        return x
+        boards = board.ravel()[SYM_IDX].reshape(-1, 3, 3)  # one gather instead of 8 rot90/fliplr calls
+        pis = np.asarray(pi[:-1])[SYM_IDX]
+        return [(b, list(p) + [pi[-1]]) for b, p in zip(boards, pis)]  # same here with pass move
 
     def translate(self, board: np.array, player: int, index: int):
         return index
@@ -92,31 +158,26 @@ class TicTacToeGame(IGame):
         return move
 
     def stringRepresentation(self, board):
-        return board.tostring()
+        x, o = self.toBitBoard(board)
+        return (x << 9) | o  # native int hashes faster than 72 raw bytes
 
     def drawTerminal(self, board: np.array, valid_moves: bool, cur_player: int, *args: any):
         if valid_moves:
-            return str([i for (i, valid) in enumerate(self.getValidMoves(board, 1)) if valid])
+            return str(np.flatnonzero(self.getValidMoves(board, 1)).tolist())
         else:
-            output = "\n"
+            cells = {0: '   ', 1: ' X ', -1: ' O '}
+            separator = '-' * (4 * self.n - 1) + '\n'
+            parts = ['\n']  # build a list and join once instead of repeated str +=
             for row in range(self.n):
-                for col in range(self.n):
-                    if board[row][col] == 0:
-                        output += '   '
-                    elif board[row][col] == 1:
-                        output += ' X '
-                    else:
-                        output += ' O '
-                    if col < self.n - 1:
-                        output += '|'
-                output += '\n'
+                parts.append('|'.join(cells[cell] for cell in board[row]))
+                parts.append('\n')
                 if row < self.n - 1:
-                    output += '-' * (4 * self.n - 1) + '\n'
-
-            return output
+                    parts.append(separator)
+            return ''.join(parts)
 
     def draw(self, board: np.array, valid_moves: bool, cur_player: int, *args: any):
-        import pygame
+        if pygame is None:
+            raise ImportError("pygame is required for draw()")
         row_count = board.shape[0]
         col_count = board.shape[1]
         SQUARESIZE = 100
@@ -129,39 +190,48 @@ class TicTacToeGame(IGame):
         color_O = (44, 62, 80)  # dark blue
         color_valid = (144, 238, 144)  # turquoise
 
-        pygame.init()
+        if not TicTacToeGame._pygame_initialized:
+            pygame.init()
+            TicTacToeGame._pygame_initialized = True
+
+        if TicTacToeGame._bg_surface is None or TicTacToeGame._bg_surface.get_size() != (WIDTH, HEIGHT):
+            # render the static background (fill + grid) and the three cell
+            # glyphs once; every later frame only blits them
+            bg = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            bg.fill(color_background)
+            for row in range(1, row_count):
+                pygame.draw.line(bg, color_grid,
+                                 (0, row * SQUARESIZE),
+                                 (WIDTH, row * SQUARESIZE),
+                                 7)
+            for col in range(1, col_count):
+                pygame.draw.line(bg, color_grid,
+                                 (col * SQUARESIZE, 0),
+                                 (col * SQUARESIZE, HEIGHT),
+                                 7)
+            TicTacToeGame._bg_surface = bg
+
+            x_surface = pygame.Surface((SQUARESIZE, SQUARESIZE), pygame.SRCALPHA)
+            pygame.draw.line(x_surface, color_X, (15, 15), (SQUARESIZE - 15, SQUARESIZE - 15), 13)
+            pygame.draw.line(x_surface, color_X, (15, SQUARESIZE - 15), (SQUARESIZE - 15, 15), 13)
+            TicTacToeGame._x_surface = x_surface
+
+            o_surface = pygame.Surface((SQUARESIZE, SQUARESIZE), pygame.SRCALPHA)
+            pygame.draw.circle(o_surface, color_O, (SQUARESIZE // 2, SQUARESIZE // 2), SQUARESIZE // 2 - 15, 10)
+            TicTacToeGame._o_surface = o_surface
+
+            valid_surface = pygame.Surface((SQUARESIZE, SQUARESIZE), pygame.SRCALPHA)
+            pygame.draw.circle(valid_surface, color_valid, (SQUARESIZE // 2, SQUARESIZE // 2), SQUARESIZE // 8)
+            TicTacToeGame._valid_surface = valid_surface
 
         surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        surface.fill(color_background)
-
-        for row in range(1, row_count):
-            pygame.draw.line(surface, color_grid,
-                             (0, row * SQUARESIZE),
-                             (WIDTH, row * SQUARESIZE),
-                             7)
-        for col in range(1, col_count):
-            pygame.draw.line(surface, color_grid,
-                             (col * SQUARESIZE, 0),
-                             (col * SQUARESIZE, HEIGHT),
-                             7)
-
-        for row in range(len(board)):
-            for col in range(len(board[row])):
-                if valid_moves and board[row][col] == 0:
-                    pygame.draw.circle(surface, color_valid,
-                                       (col * SQUARESIZE + SQUARESIZE // 2, row * SQUARESIZE + SQUARESIZE // 2),
-                                       SQUARESIZE // 8)
-                if board[row][col] == 1:
-                    pygame.draw.line(surface, color_X,
-                                     (col * SQUARESIZE + 15, row * SQUARESIZE + 15),
-                                     (col * SQUARESIZE + SQUARESIZE - 15, row * SQUARESIZE + SQUARESIZE - 15),
-                                     13)
-                    pygame.draw.line(surface, color_X,
-                                     (col * SQUARESIZE + 15, row * SQUARESIZE + SQUARESIZE - 15),
-                                     (col * SQUARESIZE + SQUARESIZE - 15, row * SQUARESIZE + 15),
-                                     13)
-                elif board[row][col] == -1:
-                    pygame.draw.circle(surface, color_O,
-                                       (col * SQUARESIZE + SQUARESIZE // 2, row * SQUARESIZE + SQUARESIZE // 2),
-                                       SQUARESIZE // 2 - 15, 10)
+        surface.blit(TicTacToeGame._bg_surface, (0, 0))
+
+        if valid_moves:
+            for row, col in np.argwhere(board == 0):
+                surface.blit(TicTacToeGame._valid_surface, (col * SQUARESIZE, row * SQUARESIZE))
+        for row, col in np.argwhere(board == 1):
+            surface.blit(TicTacToeGame._x_surface, (col * SQUARESIZE, row * SQUARESIZE))
+        for row, col in np.argwhere(board == -1):
+            surface.blit(TicTacToeGame._o_surface, (col * SQUARESIZE, row * SQUARESIZE))
         return surface
\ No newline at end of file
@@ -16,6 +16,13 @@ Based on the board for the game of Othello by Eric P. Nichols.
 """
 
 
+# All 8 winning lines of the default 3x3 board as 9-bit masks.
+# Bit i of a mask corresponds to the flattened cell (i // 3, i % 3).
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,  # rows
+             0b001001001, 0b010010010, 0b100100100,  # columns
+             0b100010001, 0b001010100)  # diagonals
+
+
 # from bkcharts.attributes import color
 class Board():
 
@@ -56,9 +63,16 @@ class Board():
         return False
     
     def is_win(self, color):
-        """Check whether the given player has collected a triplet in any direction; 
+        """Check whether the given player has collected a triplet in any direction;
         @param color (1=white,-1=black)
         """
+        if self.n == 3:
+            mask = 0
+            for x in range(3):
+                for y in range(3):
+                    if self[x][y] == color:
+                        mask |= 1 << (3 * x + y)
+            return any((mask & m) == m for m in WIN_MASKS)
         win = self.n
         # check y-strips
         for y in range(self.n):
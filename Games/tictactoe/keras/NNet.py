@@ -41,31 +41,60 @@ class NNetWrapper(NeuralNet):
         self.nnet = onnet(game, args)
         self.board_x, self.board_y = game.getBoardSize()
         self.action_size = game.getActionSize()
+        # optional quantized TFLite inference path, used when a .tflite file
+        # is found next to the checkpoint (see export_tflite)
+        self.interpreter = None
+        self._tfl_in = None
+        self._tfl_pi = None
+        self._tfl_v = None
+        self._tfl_batch = 0
+        # reusable single-board input buffer for predict()
+        self._scratch = np.empty((1, self.board_x, self.board_y), dtype=np.float32)
 
     def train(self, examples):
         """
         examples: list of examples, each example is of form (board, pi, v)
         """
-        input_boards, target_pis, target_vs = list(zip(*examples))
-        input_boards = np.asarray(input_boards)
-        target_pis = np.asarray(target_pis)
-        target_vs = np.asarray(target_vs)
+        # fill preallocated arrays in one pass instead of materializing the
+        # transposed list-of-tuples from zip(*examples) and re-copying it
+        n = len(examples)
+        input_boards = np.empty((n, self.board_x, self.board_y), dtype=np.float32)
+        target_pis = np.empty((n, self.action_size), dtype=np.float32)
+        target_vs = np.empty(n, dtype=np.float32)
+        for i, (board, pi, v) in enumerate(examples):
+            input_boards[i] = board
+            target_pis[i] = pi
+            target_vs[i] = v
         self.nnet.model.fit(x=input_boards, y=[target_pis, target_vs], batch_size=args.batch_size, epochs=args.epochs)
 
+    def predict_batch(self, boards):
+        """
+        boards: np array of shape (batch, board_x, board_y)
+        """
+        # no-op when the input is already contiguous float32 (e.g. the scratch
+        # buffer from predict), otherwise a single cast+copy
+        boards = np.ascontiguousarray(boards, dtype=np.float32)
+        if self.interpreter is not None:
+            if self._tfl_batch != len(boards):
+                self.interpreter.resize_tensor_input(self._tfl_in, boards.shape)
+                self.interpreter.allocate_tensors()
+                self._tfl_batch = len(boards)
+            self.interpreter.set_tensor(self._tfl_in, boards)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self._tfl_pi), self.interpreter.get_tensor(self._tfl_v)
+        # calling the model directly skips the predict() wrapper overhead
+        # (callback setup, data adapter), which dominates for small batches
+        pi, v = self.nnet.model(boards, training=False)
+        return pi.numpy(), v.numpy()
+
     def predict(self, board):
         """
         board: np array with board
         """
-        # timing
-        start = time.time()
-
-        # preparing input
-        board = board[np.newaxis, :, :]
-
-        # run
-        pi, v = self.nnet.model.predict(board, verbose=False)
-
-        #print('PREDICTION TIME TAKEN : {0:03f}'.format(time.time()-start))
+        # copy into the preallocated float32 buffer instead of allocating a
+        # new view + cast per call; predict is called once per MCTS expansion
+        np.copyto(self._scratch[0], board, casting="unsafe")
+        pi, v = self.predict_batch(self._scratch)
         return pi[0], v[0]
 
     def save_checkpoint(self, folder='checkpoint', filename='checkpoint.pth.tar'):
@@ -90,3 +119,38 @@ class NNetWrapper(NeuralNet):
             raise ValueError("No model in path '{}'".format(filepath))
         self.nnet.model.load_weights(filepath)
 
+        # use the quantized inference-only model when one was exported
+        tflite_path = filepath.rsplit(".", 1)[0] + ".tflite"
+        if os.path.exists(tflite_path):
+            self.load_tflite(tflite_path)
+
+    def load_tflite(self, filepath):
+        """
+        Routes predict/predict_batch through a TFLite interpreter, which runs
+        the quantized inference-only graph instead of the keras training graph.
+        """
+        import tensorflow as tf
+
+        self.interpreter = tf.lite.Interpreter(model_path=filepath)
+        self.interpreter.allocate_tensors()
+        self._tfl_in = self.interpreter.get_input_details()[0]['index']
+        # identify the two outputs by shape: pi has action_size entries, v has one
+        outputs = self.interpreter.get_output_details()
+        self._tfl_pi = next(o['index'] for o in outputs if o['shape'][-1] == self.action_size)
+        self._tfl_v = next(o['index'] for o in outputs if o['shape'][-1] != self.action_size)
+        self._tfl_batch = 1
+
+    def export_tflite(self, folder='checkpoint', filename='checkpoint.tflite'):
+        """
+        One-shot export of the loaded model to a quantized .tflite file next to
+        the .h5 checkpoint. Uses dynamic-range quantization (no representative
+        dataset needed); load_checkpoint picks the file up automatically.
+        """
+        import tensorflow as tf
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.nnet.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        filename = filename.split(".")[0] + ".tflite"
+        with open(os.path.join(folder, filename), "wb") as f:
+            f.write(converter.convert())
+
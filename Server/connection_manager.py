@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from json import dumps
 from fastapi import WebSocket
 from starlette.websockets import WebSocketState
 
@@ -11,7 +13,7 @@ class AbstractConnectionManager(ABC):
     Abstract base class for managing WebSocket connections.
 
     Attributes:
-        active_connections (list[WebSocket]): List to store active WebSocket connections.
+        active_connections (set[WebSocket]): Set to store active WebSocket connections.
         msg_builder (LanguageHandler): Instance to handle language-specific messages.
         language (LANGUAGE): Default language for the connection manager.
     """
@@ -23,8 +25,12 @@ class AbstractConnectionManager(ABC):
         Args:
             msg_builder (LanguageHandler): Language handler instance.
         """
-        self.active_connections: list[WebSocket] = []
+        # set: membership checks and removals stay O(1) under client churn
+        self.active_connections: set[WebSocket] = set()
         self.msg_builder: LanguageHandler = msg_builder
+        # serialized data-less responses keyed by (code, localized message);
+        # acks and error strings repeat constantly and never change
+        self.__response_cache: dict[tuple[int, str], str] = {}
 
     @abstractmethod
     async def connect(self, websocket: WebSocket):
@@ -69,12 +75,22 @@ class AbstractConnectionManager(ABC):
         """
         if client is None:
             return
+        msg = self.msg_builder.get(code.value, client)
+        if not data:
+            # same compact format send_json produces, serialized only once
+            cache_key = (code.value, msg)
+            text = self.__response_cache.get(cache_key)
+            if text is None:
+                text = dumps({"response_code": code.value, "response_msg": msg}, separators=(",", ":"))
+                self.__response_cache[cache_key] = text
+            if client.client_state == WebSocketState.CONNECTED:
+                await client.send_text(text)
+            return
         cmd = {
             "response_code": code.value,
-            "response_msg": self.msg_builder.get(code.value, client)
+            "response_msg": msg
         }
-        if data:
-            cmd.update(data)
+        cmd.update(data)
         if client.client_state == WebSocketState.CONNECTED:
             await client.send_json(cmd)
 
@@ -87,10 +103,10 @@ class AbstractConnectionManager(ABC):
             code (RCODE): Response code.
             data (dict, optional): Additional data to be included in the response.
         """
-        for c in client_list:
-            if c is not None:
-                if c.client_state == WebSocketState.CONNECTED:
-                    await self.send_response(c, code, data)
+        # send to all recipients concurrently instead of one kernel write at a time
+        await asyncio.gather(*(self.send_response(c, code, data)
+                               for c in client_list
+                               if c is not None and c.client_state == WebSocketState.CONNECTED))
 
     async def send_cmd(self, game_client: WebSocket, command: str, command_key: str, data: dict = None):
         """
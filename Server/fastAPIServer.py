@@ -43,6 +43,19 @@ class FastAPIServer(AbstractConnectionManager):
                                           "move", "lang", "fromPos", "isFrontend"]
         self.__play_mask: list[str] = ["create", "valid_moves", "make_move", "undo_move", "surrender",
                                        "new_game", "blunder", "timeline", "step", "unstep", "image"]
+        # dict dispatch: one hash lookup per message instead of a literal-by-
+        # literal comparison chain through the match statements
+        self.__command_handlers = {"debug": self.handle_debug_command,
+                                   "lobby": self.handle_lobby,
+                                   "play": self.handle_play_command,
+                                   "client": self.handle_client}
+        self.__lobby_handlers = {"create": self.__lobby_create,
+                                 "join": self.__lobby_join,
+                                 "leave": self.__lobby_leave,
+                                 "swap": self.__lobby_swap,
+                                 "pos": self.__lobby_pos,
+                                 "status": self.__lobby_status,
+                                 "games": self.__lobby_games}
 
     async def connect(self, websocket: WebSocket):
         """
@@ -52,7 +65,7 @@ class FastAPIServer(AbstractConnectionManager):
             websocket (WebSocket): The WebSocket connection to the client.
         """
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     async def disconnect(self, websocket: WebSocket):
         """
@@ -97,17 +110,11 @@ class FastAPIServer(AbstractConnectionManager):
                     continue
 
                 command = read_object.get("command")
-                match command:
-                    case "debug":
-                        self.submit_task(loop, self.handle_debug_command, client, read_object)
-                    case "lobby":
-                        self.submit_task(loop, self.handle_lobby, client, read_object)
-                    case "play":
-                        self.submit_task(loop, self.handle_play_command, client, read_object)
-                    case "client":
-                        self.submit_task(loop, self.handle_client, client, read_object)
-                    case _:
-                        await self.send_response(client, RCODE.COMMANDNOTFOUND, {"command": command})
+                handler = self.__command_handlers.get(command)
+                if handler is None:
+                    await self.send_response(client, RCODE.COMMANDNOTFOUND, {"command": command})
+                    continue
+                self.submit_task(loop, handler, client, read_object)
         except WebSocketDisconnect as e:
             code = {1000: "Normal disconnect", 1001: "Browser reload/tab close", 1006: "Critical connection break!"}
             print(client.client, f"WebSocket disconnected with code: {e.code}, {code.get(e.code)}")
@@ -156,78 +163,86 @@ class FastAPIServer(AbstractConnectionManager):
             read_object (dict): The received command object.
         """
         command_key = read_object.get("command_key")
-        match command_key:
-            case "create":
-                lobby = self.manager.get_lobby(client)
-                if lobby:
-                    return await self.send_response(client=client, code=RCODE.L_CLIENTALREADYINLOBBY)
-                new_lobby_key = self.manager.create_lobby()
-                self.manager.join_lobby(new_lobby_key, client, "p1")
-                await self.send_response(client=client, code=RCODE.L_CREATED, data={"key": new_lobby_key})
-            case "join":
-                lobby_key = read_object.get("key")
-                lobby: Lobby = self.manager.get_lobby(lobby_key)
-                if lobby is None:
-                    return await self.send_response(client=client, code=RCODE.L_LOBBYNOTEXIST, data={"key": lobby_key})
-                lobby_key = read_object.get("key")
-                pos = read_object.get("pos")
-                if lobby.game_running:
-                    if pos != "sp":
-                        return await self.send_response(client=client, code=RCODE.L_RUNNINGNOJOIN)
-                    else:  # pos is sp
-                        await self.send_cmd(game_client=lobby.game_client,
-                                            command="",
-                                            command_key="image")
-                if not self.manager.join_lobby(lobby_key, client, pos):
-                    return await self.send_response(client=client, code=RCODE.L_CLIENTALREADYINLOBBY,
-                                                    data={"key": lobby_key})
-                await self.broadcast_response(client_list=lobby.get(None), code=RCODE.L_JOINED,
-                                              data={"pos": self.manager.get_pos_of_client(client)})
-            case "leave":
-                lobby: Lobby = self.manager.get_lobby(client)
-                if lobby is None:
-                    return await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
-                pos = self.manager.get_pos_of_client(client)
-                client_list = lobby.get(None)
-                if not self.manager.leave_lobby(client):
-                    if lobby.game_running and lobby.in_lobby(client):
-                        return await self.send_response(client=client, code=RCODE.L_NOLEAVEACTIVPLAYER)
-                await self.broadcast_response(client_list=client_list, code=RCODE.L_LEFT,
-                                              data={"pos": pos})
-            case "swap":
-                pos: str = read_object.get("pos")
-                lobby: Lobby = self.manager.get_lobby(client)
-                if lobby is None:
-                    return await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
-                if lobby.game_running:
-                    if lobby.in_lobby(client):
-                        return await self.send_response(client=client, code=RCODE.L_NOSWAP)
-                if pos not in ["p1", "p2", "sp"]:
-                    return await self.send_response(client=client, code=RCODE.L_POSUNKNOWN, data={"pos": pos})
-                if not self.manager.swap_to(pos, client):
-                    return await self.send_response(client=client, code=RCODE.L_POSOCCUPIED, data={"pos": pos})
-                await self.broadcast_response(client_list=lobby.get(None), code=RCODE.L_SWAPPED, data={"pos": pos})
-            case "pos":
-                pos: str = self.manager.get_pos_of_client(client)
-                if pos:
-                    await self.send_response(client=client, code=RCODE.L_POS, data={"pos": pos})
-                else:  # client not in lobby
-                    await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
-            case "status":
-                lobby: Lobby = self.manager.get_lobby(client)
-                if lobby:  # success
-                    await self.send_response(client=client, code=RCODE.L_STATUS, data=lobby.status())
-                else:  # client not in lobby
-                    await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
-            case "games":
-                lobby: Lobby = self.manager.get_lobby(client)
-                if lobby:  # success
-                    await self.send_response(client=client, code=RCODE.L_GAMES,
-                                             data={"games": [k for k in self.importer.get_games().keys()]})
-                else:  # client not in lobby
-                    await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
-            case _:
-                await self.send_response(client=client, code=RCODE.COMMANDNOTFOUND, data={"command_key": command_key})
+        handler = self.__lobby_handlers.get(command_key)
+        if handler is None:
+            return await self.send_response(client=client, code=RCODE.COMMANDNOTFOUND,
+                                            data={"command_key": command_key})
+        await handler(client, read_object)
+
+    async def __lobby_create(self, client: WebSocket, read_object: dict):
+        lobby = self.manager.get_lobby(client)
+        if lobby:
+            return await self.send_response(client=client, code=RCODE.L_CLIENTALREADYINLOBBY)
+        new_lobby_key = self.manager.create_lobby()
+        self.manager.join_lobby(new_lobby_key, client, "p1")
+        await self.send_response(client=client, code=RCODE.L_CREATED, data={"key": new_lobby_key})
+
+    async def __lobby_join(self, client: WebSocket, read_object: dict):
+        lobby_key = read_object.get("key")
+        lobby: Lobby = self.manager.get_lobby(lobby_key)
+        if lobby is None:
+            return await self.send_response(client=client, code=RCODE.L_LOBBYNOTEXIST, data={"key": lobby_key})
+        pos = read_object.get("pos")
+        if lobby.game_running:
+            if pos != "sp":
+                return await self.send_response(client=client, code=RCODE.L_RUNNINGNOJOIN)
+            else:  # pos is sp
+                await self.send_cmd(game_client=lobby.game_client,
+                                    command="",
+                                    command_key="image")
+        if not self.manager.join_lobby(lobby_key, client, pos):
+            return await self.send_response(client=client, code=RCODE.L_CLIENTALREADYINLOBBY,
+                                            data={"key": lobby_key})
+        await self.broadcast_response(client_list=lobby.get(None), code=RCODE.L_JOINED,
+                                      data={"pos": self.manager.get_pos_of_client(client)})
+
+    async def __lobby_leave(self, client: WebSocket, read_object: dict):
+        lobby: Lobby = self.manager.get_lobby(client)
+        if lobby is None:
+            return await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
+        pos = self.manager.get_pos_of_client(client)
+        client_list = lobby.get(None)
+        if not self.manager.leave_lobby(client):
+            if lobby.game_running and lobby.in_lobby(client):
+                return await self.send_response(client=client, code=RCODE.L_NOLEAVEACTIVPLAYER)
+        await self.broadcast_response(client_list=client_list, code=RCODE.L_LEFT,
+                                      data={"pos": pos})
+
+    async def __lobby_swap(self, client: WebSocket, read_object: dict):
+        pos: str = read_object.get("pos")
+        lobby: Lobby = self.manager.get_lobby(client)
+        if lobby is None:
+            return await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
+        if lobby.game_running:
+            if lobby.in_lobby(client):
+                return await self.send_response(client=client, code=RCODE.L_NOSWAP)
+        if pos not in ["p1", "p2", "sp"]:
+            return await self.send_response(client=client, code=RCODE.L_POSUNKNOWN, data={"pos": pos})
+        if not self.manager.swap_to(pos, client):
+            return await self.send_response(client=client, code=RCODE.L_POSOCCUPIED, data={"pos": pos})
+        await self.broadcast_response(client_list=lobby.get(None), code=RCODE.L_SWAPPED, data={"pos": pos})
+
+    async def __lobby_pos(self, client: WebSocket, read_object: dict):
+        pos: str = self.manager.get_pos_of_client(client)
+        if pos:
+            await self.send_response(client=client, code=RCODE.L_POS, data={"pos": pos})
+        else:  # client not in lobby
+            await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
+
+    async def __lobby_status(self, client: WebSocket, read_object: dict):
+        lobby: Lobby = self.manager.get_lobby(client)
+        if lobby:  # success
+            await self.send_response(client=client, code=RCODE.L_STATUS, data=lobby.status())
+        else:  # client not in lobby
+            await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
+
+    async def __lobby_games(self, client: WebSocket, read_object: dict):
+        lobby: Lobby = self.manager.get_lobby(client)
+        if lobby:  # success
+            await self.send_response(client=client, code=RCODE.L_GAMES,
+                                     data={"games": [k for k in self.importer.get_games().keys()]})
+        else:  # client not in lobby
+            await self.send_response(client=client, code=RCODE.L_CLIENTNOTINLOBBY)
 
     async def handle_play_command(self, client: WebSocket, read_object: dict):
         """
@@ -1,4 +1,5 @@
 import os
+from collections import deque
 from datetime import datetime, timezone
 from hashlib import sha256
 from fastapi import WebSocket
@@ -13,6 +14,15 @@ class LobbyManager:
         # Initialize the LobbyManager with an empty dictionary of lobbies and a DockerAPI instance
         self.lobbies: dict[str, Lobby] = {}
         self.docker: DockerAPI = DockerAPI()
+        # Prewarmed game clients: containers started ahead of time so lobby
+        # creation does not wait on a docker run (hundreds of ms). Keys in
+        # the deque have a running container but no lobby yet; clients that
+        # already connected are parked in _prewarmed_clients until adopted.
+        self.pool_size: int = int(os.environ.get("CLIENT_POOL", 0))
+        self._prewarmed: deque[str] = deque()
+        self._prewarmed_clients: dict[str, WebSocket] = {}
+        if self.pool_size > 0:
+            Thread(target=self.__fill_pool).start()  # start up without waiting on docker
 
     def _generate_lobby_key(self) -> str:
         # Generate a unique lobby key using the current UTC timestamp and SHA256 hash
@@ -21,13 +31,37 @@ class LobbyManager:
         key_len = int(os.environ["KEYLEN"])
         if key_len > 0:
             sha256_hash = sha256_hash[:key_len]
-        if sha256_hash in self.lobbies.keys():  # Check if the hash already exists in the lobbies dictionary
+        # Check if the hash already exists in the lobbies or the prewarmed pool
+        if sha256_hash in self.lobbies.keys() or sha256_hash in self._prewarmed:
             # Recursively generate a new lobby key if the hash already exists
             return self._generate_lobby_key()
             # Return the unique SHA256 hash
         return sha256_hash
 
+    def __fill_pool(self):
+        # Internal method to top the prewarmed pool up to its configured size
+        while len(self._prewarmed) < self.pool_size:
+            key: str = self._generate_lobby_key()
+            self._prewarmed.append(key)
+            self.docker.start_game_client(key)
+
+    def is_prewarmed(self, key: str) -> bool:
+        # Check if a key belongs to a prewarmed game client without a lobby yet
+        return key in self._prewarmed
+
+    def register_prewarmed_client(self, key: str, game_client: WebSocket):
+        # Park the websocket of a prewarmed game client until its key is adopted
+        self._prewarmed_clients[key] = game_client
+
     def create_lobby(self) -> str:
+        # Adopt a prewarmed game client when one is available
+        if self._prewarmed:
+            key: str = self._prewarmed.popleft()
+            lobby = Lobby(key)
+            lobby.game_client = self._prewarmed_clients.pop(key, None)
+            self.lobbies[key] = lobby
+            Thread(target=self.__fill_pool).start()  # refill without blocking the create
+            return key
         # Create a new lobby with a unique key
         key: str = self._generate_lobby_key()
         self.lobbies[key] = Lobby(key)
@@ -124,6 +158,15 @@ class LobbyManager:
         # Disconnect a game client from its lobby
         lobby: Lobby = self.get_lobby(game_client)
         if lobby is None:
+            # a prewarmed client that died before adoption leaves the pool
+            for key, client in self._prewarmed_clients.items():
+                if client == game_client:
+                    self._prewarmed_clients.pop(key)
+                    try:
+                        self._prewarmed.remove(key)
+                    except ValueError:
+                        pass
+                    return True
             return False  # game client not in a lobby
         lobby.game_client = None
         return True  # game client removed from lobby
@@ -1,5 +1,8 @@
 import asyncio
+import hashlib
 import io
+import threading
+from collections import OrderedDict
 
 import numpy as np
 import pygame
@@ -20,23 +23,31 @@ environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # disable some logging features
 
 
 class SocketServer(AbstractConnectionManager):
+    IMG_CACHE_SIZE = 256  # encoded frames kept per server (LRU)
+
     def __init__(self, msg_builder: LanguageHandler):
         super().__init__(msg_builder)
         self.manager: LobbyManager = LobbyManager()
         self.executor = ThreadPoolExecutor()  # Global Thread Executor without any Thread limits
         self.importer: Importer = Importer("/app/Games")
+        self.img_cache: OrderedDict[bytes, bytes] = OrderedDict()  # pixel hash -> encoded PNG
+        self.img_cache_lock = threading.Lock()  # draw() encodes in worker threads
 
     async def connect(self, websocket: WebSocket):
         query_params = websocket.query_params
         login = query_params.get("login", "")
-        if login not in self.manager.lobbies.keys():
+        if login in self.manager.lobbies.keys():
+            self.manager.lobbies.get(login).game_client = websocket
+        elif self.manager.is_prewarmed(login):
+            # prewarmed game client without a lobby yet; parked until adoption
+            self.manager.register_prewarmed_client(login, websocket)
+        else:
             return await websocket.close(code=1008, reason="Unauthorized")
-        self.manager.lobbies.get(login).game_client = websocket
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     async def disconnect(self, websocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         self.manager.disconnect_game_client(websocket)
 
     def submit_task(self, loop, coro, *args):
@@ -55,12 +66,23 @@ class SocketServer(AbstractConnectionManager):
     def player_to_pos(cur_player: int) -> str:
         return "p1" if cur_player == 1 else "p2"
 
-    @staticmethod
-    def surface_to_png(img: pygame.surface) -> bytes:
+    def surface_to_png(self, img: pygame.surface) -> bytes:
+        # identical surfaces are re-sent constantly (timeline scrubbing, valid_moves,
+        # spectator joins), so cache the encoded PNG keyed by the raw pixel content
+        key = hashlib.blake2b(pygame.image.tobytes(img, "RGBA"), digest_size=16).digest()
+        with self.img_cache_lock:
+            png_bytes = self.img_cache.get(key)
+            if png_bytes is not None:
+                self.img_cache.move_to_end(key)
+                return png_bytes
         byte_io = io.BytesIO()
         pygame.image.save(img, byte_io, 'PNG')
         png_bytes = byte_io.getvalue()
         byte_io.close()
+        with self.img_cache_lock:
+            self.img_cache[key] = png_bytes
+            if len(self.img_cache) > self.IMG_CACHE_SIZE:
+                self.img_cache.popitem(last=False)
         return png_bytes
 
     async def websocket_endpoint(self, websocket: WebSocket):
@@ -138,23 +160,28 @@ class SocketServer(AbstractConnectionManager):
         from_pos: int = read_object.get("from_pos")
         default = game.getInitBoard()
         board = np.array(array, dtype=default.dtype).reshape(default.shape)
-        img_surface1 = game.draw(board, valid, 1, from_pos)
-        img_surface2 = game.draw(board, valid, -1, from_pos)
-        img1 = self.surface_to_png(img_surface1)
-        img2 = self.surface_to_png(img_surface2)
+        # rendering and PNG encoding are pure CPU work; run them in a worker
+        # thread so the event loop keeps serving other lobbies meanwhile
+        img1, img2 = await asyncio.to_thread(self.render_board, game, board, valid, from_pos)
         if p_pos is None:
-            # broadcast
+            # broadcast: push all image frames concurrently instead of awaiting each send
             clients = lobby.get(p_pos)
-            spec = clients[:-2]
-            for c in spec:
-                await self.send_bytes(c, img1)  # spectators
-            await self.send_bytes(clients[-2], img1)  # p1
-            await self.send_bytes(clients[-1], img2)  # p2
+            sends = [self.send_bytes(c, img1) for c in clients[:-2]]  # spectators
+            sends.append(self.send_bytes(clients[-2], img1))  # p1
+            sends.append(self.send_bytes(clients[-1], img2))  # p2
+            await asyncio.gather(*sends)
         else:
             # to p_pos
             img = img1 if p_pos == "p1" else img2
             await self.send_bytes(lobby.get(p_pos), img)
 
+    def render_board(self, game: IGame, board: np.array, valid: bool, from_pos: int) -> tuple[bytes, bytes]:
+        # both perspectives in one thread hop; game.draw reuses cached surfaces,
+        # so keeping the pair in a single thread avoids racing that cache
+        img_surface1 = game.draw(board, valid, 1, from_pos)
+        img_surface2 = game.draw(board, valid, -1, from_pos)
+        return self.surface_to_png(img_surface1), self.surface_to_png(img_surface2)
+
     async def blunder(self, game: IGame, mcts, actions: any, game_client: WebSocket, p_pos: str):
         func = lambda x, y: mcts.get_action_prob(x, y, temp=1)
         blunder_list = []
@@ -22,11 +22,9 @@ class EDifficulty(Enum):
         # Return None if the input difficulty string is None
         if difficulty is None:
             return None
-        # Iterate over each member in the EDifficulty enumeration
-        for m in EDifficulty:
-            # Compare the input string with the name of the enum member (case-insensitive)
-            if m.name.lower() == difficulty.lower():
-                # Return the matching enum member
-                return m
-        # Return None if no match is found
-        return None
+        # Look up the lowercased name in the precomputed map (None if no match)
+        return _DIFFICULTY_BY_NAME.get(difficulty.lower())
+
+
+# Precomputed name -> member map so get() is a dict lookup instead of an enum scan
+_DIFFICULTY_BY_NAME = {m.name.lower(): m for m in EDifficulty}
@@ -21,11 +21,9 @@ class EGameMode(Enum):
         # If no mode is provided, return None
         if mode is None:
             return None
-        # Iterate through all possible game modes
-        for m in EGameMode:
-            # Check if the mode name matches the provided string (case insensitive)
-            if m.name.lower() == mode.lower():
-                # Return the matching game mode
-                return m
-        # If no match is found, return None
-        return None
+        # Look up the lowercased name in the precomputed map (None if no match)
+        return _MODE_BY_NAME.get(mode.lower())
+
+
+# Precomputed name -> member map so get() is a dict lookup instead of an enum scan
+_MODE_BY_NAME = {m.name.lower(): m for m in EGameMode}
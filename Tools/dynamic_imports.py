@@ -77,6 +77,7 @@ class Importer:
         print(f"\033[94m[{self.__class__.__name__}]", "Fetching files...")
         self.__path: dict[str, Entry] = self.__crawl_game_files(directory)
         self.__game_classes = {}
+        self.__game_instances = None  # built lazily, then reused on every get_games()
         self.__game_mcts = {}
 
         if ExcludeModule.GAME_PY not in exclude:  # get all game classes
@@ -87,7 +88,11 @@ class Importer:
         print(f"\033[94m[{self.__class__.__name__}]", f"Initialised fully in {end-start:.4}s.\033[0m")
 
     def get_games(self) -> dict[str, IGame]:
-        return {k: game() for k, game in self.__game_classes.items()}
+        # game objects are stateless between calls, so instantiate them once
+        # instead of rebuilding the whole dict per create/games command
+        if self.__game_instances is None:
+            self.__game_instances = {k: game() for k, game in self.__game_classes.items()}
+        return self.__game_instances
 
     def get_ai_func(self) -> dict:
         return self.__game_funcs
@@ -188,6 +193,11 @@ class Importer:
                 nn.load_checkpoint(entry.keras.model_path, entry.keras.model_file)
                 sys.stdout = old_std  # restore old stdout
 
+            if nn is not None:
+                # warm up: the first inference triggers graph tracing/autotuning,
+                # pay that multi-second hitch at startup instead of on the first move
+                nn.predict(game.getInitBoard())
+
             result[name] = {}
             for diff in EDifficulty:
                 mcts = MCTS(game, nn, dotdict({'numMCTSSims': diff.value,